@@ -1,10 +1,19 @@
 
 import os
+from functools import lru_cache
+from urllib.parse import quote_plus
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
+@lru_cache(maxsize=2048)
+def _build_verse_url(reference: str, translation: str, base: str) -> str:
+    """Build (and memoize) the API URL for a reference."""
+    clean_ref = quote_plus(reference.strip(), safe=":,")
+    return f"{base}/{clean_ref}?translation={translation}"
+
+
 class BibleConfig:
     """Configuration for Bible API."""
     
@@ -23,6 +32,14 @@ class BibleConfig:
     
     ENABLE_CACHE = os.getenv("BIBLE_ENABLE_CACHE", "True").lower() == "true"
     CACHE_TTL_HOURS = int(os.getenv("BIBLE_CACHE_TTL_HOURS", "168"))  # 7 days
+    # Kept short so memory never outlives the backing cache by much
+    HOT_CACHE_TTL_SECONDS = int(os.getenv("BIBLE_HOT_CACHE_TTL_SECONDS", "600"))
+    # ETag/Last-Modified outlive the verse cache so expired verses revalidate
+    VALIDATOR_TTL_HOURS = int(os.getenv("BIBLE_VALIDATOR_TTL_HOURS", "2160"))  # 90 days
+    
+    # "file" (per-process .cache dir) or "redis" (shared across workers)
+    CACHE_BACKEND = os.getenv("CACHE_BACKEND", "file").lower()
+    REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
     
     @classmethod
     def get_verse_url(cls, reference: str) -> str:
@@ -35,9 +52,7 @@ class BibleConfig:
         Returns:
             Full API URL
         """
-      
-        clean_ref = reference.strip().replace(" ", "+")
-        return f"{cls.BASE_URL}/{clean_ref}?translation={cls.DEFAULT_TRANSLATION}"
+        return _build_verse_url(reference, cls.DEFAULT_TRANSLATION, cls.BASE_URL)
 
 
 
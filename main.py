@@ -1,9 +1,18 @@
 
 
+import asyncio
 import logging
 import sys
 from src.bible_agent.agent import BibleAgent
+from src.bible_agent.http_client import create_session
 from src.bible_agent.server import BibleServerWithCORS
+from config.bible_config import BibleConfig
+from config.llm_config import LLMConfig
+
+try:
+    import uvloop  # Optional: faster libuv-based event loop (not on Windows)
+except ImportError:
+    uvloop = None
 
 
 logging.basicConfig(
@@ -17,16 +26,16 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    
+async def run():
+    """Own the shared HTTP session and run the server until it stops."""
     
-    try:
-        logger.info("=" * 60)
-        logger.info("📖 Bible Verse Agent Starting...")
-        logger.info("=" * 60)
-        
+    # One pooled session shared by the Bible and LLM services
+    async with create_session() as http_session:
         # Create the agent
-        agent = BibleAgent(name="Bible Verse Agent")
+        agent = BibleAgent(
+            name="Bible Verse Agent",
+            http_session=http_session
+        )
         
         
         server = BibleServerWithCORS(
@@ -35,13 +44,46 @@ def main():
         )
         
         # Run the server
+        logger.info("📚 Bible API: %s", BibleConfig.BASE_URL)
+        logger.info("📖 Translation: %s", BibleConfig.DEFAULT_TRANSLATION)
+        logger.info("🤖 LLM Model: %s", LLMConfig.MODEL)
+        if BibleConfig.ENABLE_CACHE:
+            logger.info(
+                "💾 Cache: Enabled (%s, TTL: %s hours)",
+                BibleConfig.CACHE_BACKEND,
+                BibleConfig.CACHE_TTL_HOURS
+            )
+        else:
+            logger.info("💾 Cache: Disabled")
         logger.info("🌐 CORS: Allowing all origins (*)")
         logger.info("⚠️  Remember to restrict origins in production!")
         logger.info("🚀 Server starting on http://0.0.0.0:8000")
         logger.info("💡 Test with: http://localhost:8000/health")
         logger.info("=" * 60 + "\n")
         
-        server.run(host="0.0.0.0", port=8000)
+        try:
+            async with asyncio.TaskGroup() as tg:
+                prewarm = tg.create_task(agent.prewarm())
+                await server.serve(host="0.0.0.0", port=8000)
+                # Prewarm is paced over minutes; don't hold up shutdown
+                prewarm.cancel()
+        finally:
+            await agent.close()
+
+
+def main():
+    
+    
+    try:
+        logger.info("=" * 60)
+        logger.info("📖 Bible Verse Agent Starting...")
+        logger.info("=" * 60)
+        
+        if uvloop is not None:
+            logger.info("⚡ Event loop: uvloop")
+            uvloop.run(run())
+        else:
+            asyncio.run(run())
         
     except KeyboardInterrupt:
         logger.info("\n" + "=" * 60)
@@ -49,7 +91,7 @@ def main():
         logger.info("=" * 60)
     except Exception as e:
         logger.error("=" * 60)
-        logger.error(f"❌ Fatal error: {str(e)}", exc_info=True)
+        logger.error("❌ Fatal error: %s", e, exc_info=True)
         logger.error("=" * 60)
         sys.exit(1)
 
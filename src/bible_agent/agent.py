@@ -1,6 +1,11 @@
 
 
+import asyncio
+import aiohttp
 import logging
+import re
+from typing import Dict, List, Optional
+from cachetools import TTLCache
 from sentient_agent_framework import (
     AbstractAgent,
     Session,
@@ -8,15 +13,60 @@ from sentient_agent_framework import (
     ResponseHandler
 )
 from .bible_service import BibleService
+from .http_client import close_shared_session
 from .llm_service import LLMService
 from utils.verse_parser import VerseParser
 from utils.cache import CacheManager
+from utils.redis_cache import RedisCacheManager
 from config.bible_config import BibleConfig
-from config.llm_config import LLMConfig
 
 logger = logging.getLogger(__name__)
 
 
+class _InflightQuery:
+    """
+    Shared state for a query whose answer is still being generated.
+    
+    The first request for a cache key does the work and publishes the
+    explanation chunks; identical requests arriving meanwhile subscribe
+    and replay them instead of calling the APIs again.
+    """
+    
+    def __init__(self):
+        # Resolves to the fetched verse data (or None if the leader failed)
+        self.verse: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.chunks: List[str] = []
+        self._subscribers: List[asyncio.Queue] = []
+        self._finished = False
+        # Set when the leader failed; followers report it instead of success
+        self.error: Optional[BaseException] = None
+    
+    def subscribe(self) -> asyncio.Queue:
+        """Return a queue yielding every chunk so far and to come, then None."""
+        queue = asyncio.Queue()
+        for chunk in self.chunks:
+            queue.put_nowait(chunk)
+        if self._finished:
+            queue.put_nowait(None)
+        else:
+            self._subscribers.append(queue)
+        return queue
+    
+    def publish(self, chunk: str):
+        """Record a chunk and forward it to all subscribers."""
+        self.chunks.append(chunk)
+        for queue in self._subscribers:
+            queue.put_nowait(chunk)
+    
+    def finish(self, error: Optional[BaseException] = None):
+        """Signal subscribers that no more chunks will arrive."""
+        self.error = error
+        self._finished = True
+        for queue in self._subscribers:
+            queue.put_nowait(None)
+        self._subscribers.clear()
+
+
 class BibleAgent(AbstractAgent):
     """
     Bible Verse Agent - Fetches and explains Bible verses.
@@ -38,41 +88,142 @@ class BibleAgent(AbstractAgent):
         "about"
     ]
     
-    def __init__(self, name: str = "Bible Verse Agent"):
+    # bible-api.com allows 15 requests per 30s per IP; keep prewarm well below
+    PREWARM_BATCH_SIZE = 5
+    PREWARM_INTERVAL_SECONDS = 15
+    
+    # Most requested verses, fetched in the background on startup.
+    # Written in the form VerseParser.extract_verse_reference produces.
+    PREWARM_VERSES = [
+        "John 3:16",
+        "Jeremiah 29:11",
+        "Philippians 4:13",
+        "Romans 8:28",
+        "Psalms 23:1",
+        "Proverbs 3:5",
+        "Proverbs 3:6",
+        "Isaiah 41:10",
+        "Joshua 1:9",
+        "Matthew 11:28",
+        "Romans 12:2",
+        "Philippians 4:6",
+        "Isaiah 40:31",
+        "Galatians 5:22",
+        "Hebrews 11:1",
+        "2 Timothy 1:7",
+        "1 Corinthians 13:4",
+        "Ephesians 2:8",
+        "Romans 3:23",
+        "Romans 6:23",
+        "John 14:6",
+        "Matthew 28:19",
+        "Genesis 1:1",
+        "Psalms 46:1",
+        "John 1:1",
+        "1 John 1:9",
+        "Matthew 6:33",
+        "Romans 5:8",
+        "2 Corinthians 5:17",
+        "Psalms 119:105",
+        "Matthew 7:7",
+        "Romans 10:9",
+        "John 10:10",
+        "Hebrews 12:1",
+        "1 Peter 5:7",
+        "James 1:2",
+        "Ephesians 6:10",
+        "Psalms 37:4",
+        "Deuteronomy 31:6",
+        "Isaiah 53:5",
+        "Romans 15:13",
+        "Galatians 2:20",
+        "Colossians 3:23",
+        "1 Thessalonians 5:16",
+        "Hebrews 4:12",
+        "Matthew 5:16",
+        "John 16:33",
+        "Psalms 27:1",
+        "Philippians 4:8",
+        "Revelation 21:4"
+    ]
+    
+    def __init__(
+        self,
+        name: str = "Bible Verse Agent",
+        http_session: Optional[aiohttp.ClientSession] = None
+    ):
+        """
+        Initialize the agent.
+        
+        Args:
+            name: Display name of the agent
+            http_session: Optional shared HTTP session handed to the
+                Bible and LLM services
+        """
         super().__init__(name)
         
-        logger.info(f"📖 Initializing {name}...")
+        logger.info("📖 Initializing %s...", name)
         
         # Initialize services
-        self.bible_service = BibleService()
-        self.llm_service = LLMService()
+        self.bible_service = BibleService(session=http_session)
+        self.llm_service = LLMService(session=http_session)
         self.verse_parser = VerseParser()
         
+        # Match all greeting patterns in a single case-insensitive pass
+        self._greeting_re = re.compile(
+            r"\b(" + "|".join(map(re.escape, self.GREETING_PATTERNS)) + r")\b",
+            re.IGNORECASE
+        )
+        self._greeting_response = self._build_greeting()
+        
+        # Queries currently being answered, keyed by cache key
+        self._inflight: Dict[str, _InflightQuery] = {}
+        
         # Initialize cache if enabled
         if BibleConfig.ENABLE_CACHE:
-            self.cache_manager = CacheManager(
-                cache_dir=".cache",
-                ttl_hours=BibleConfig.CACHE_TTL_HOURS
+            if BibleConfig.CACHE_BACKEND == "redis":
+                self.cache_manager = RedisCacheManager(
+                    redis_url=BibleConfig.REDIS_URL,
+                    ttl_hours=BibleConfig.CACHE_TTL_HOURS
+                )
+                self.validator_cache = RedisCacheManager(
+                    redis_url=BibleConfig.REDIS_URL,
+                    ttl_hours=BibleConfig.VALIDATOR_TTL_HOURS,
+                    key_prefix="bible_agent:validators:"
+                )
+            else:
+                self.cache_manager = CacheManager(
+                    cache_dir=".cache",
+                    ttl_hours=BibleConfig.CACHE_TTL_HOURS
+                )
+                self.validator_cache = CacheManager(
+                    cache_dir=".cache/validators",
+                    ttl_hours=BibleConfig.VALIDATOR_TTL_HOURS
+                )
+            # In-memory tier in front of the disk cache for hot verses.
+            # Entries copied from disk don't know their remaining age, so
+            # the tier uses its own short TTL rather than the full one.
+            self._hot = TTLCache(
+                maxsize=512,
+                ttl=min(
+                    BibleConfig.HOT_CACHE_TTL_SECONDS,
+                    BibleConfig.CACHE_TTL_HOURS * 3600
+                )
             )
         else:
             self.cache_manager = None
+            self.validator_cache = None
+            self._hot = None
         
-        logger.info(f"✅ {name} initialized successfully")
-        self._print_startup_info()
+        logger.info("✅ %s initialized successfully", name)
     
-    def _print_startup_info(self):
-        """Print startup information."""
-        print("\n" + "=" * 60)
-        print(f"📖 {self.name} Started")
-        print("=" * 60)
-        print(f"📚 Bible API: {BibleConfig.BASE_URL}")
-        print(f"📖 Translation: {BibleConfig.DEFAULT_TRANSLATION}")
-        print(f"🤖 LLM Model: {LLMConfig.MODEL}")
-        print(f"💾 Cache: {'Enabled' if BibleConfig.ENABLE_CACHE else 'Disabled'}")
-        if BibleConfig.ENABLE_CACHE:
-            print(f"   - TTL: {BibleConfig.CACHE_TTL_HOURS} hours")
-        print(f"🎯 Status: Ready to explain Bible verses")
-        print("=" * 60 + "\n")
+    async def close(self):
+        """Release the shared HTTP session and the cache backends' pools."""
+        await close_shared_session()
+        if self.cache_manager:
+            await self.cache_manager.close()
+            await self.validator_cache.close()
+        logger.info("🔌 Connections closed")
     
     async def assist(
         self,
@@ -84,7 +235,7 @@ class BibleAgent(AbstractAgent):
         
         try:
             user_prompt = query.prompt.strip()
-            logger.info(f"📨 Query: {user_prompt[:100]}...")
+            logger.info("📨 Query: %.100s...", user_prompt)
             
             # Check if greeting
             if self._is_greeting(user_prompt):
@@ -103,112 +254,291 @@ class BibleAgent(AbstractAgent):
                 await response_handler.complete()
                 return
             
-            logger.info(f"📖 Found verse: {verse_reference}")
+            logger.info("📖 Found verse: %s", verse_reference)
             
             # Check cache first
             cache_key = f"{verse_reference}:{user_prompt}"
-            if self.cache_manager:
-                cached_result = await self.cache_manager.get(cache_key)
-                if cached_result:
-                    logger.info(f"💾 Cache hit for: {verse_reference}")
-                    await response_handler.emit_text_block(
-                        "STATUS",
-                        "✨ Found cached explanation"
-                    )
-                    await self._stream_cached_response(
-                        cached_result, 
-                        response_handler
-                    )
-                    return
-            
-            # Fetch verse from Bible API
-            await response_handler.emit_text_block(
-                "STATUS",
-                f"📖 Looking up {verse_reference}..."
-            )
-            
-            verse_data = await self.bible_service.get_verse(verse_reference)
-            
-            if not verse_data or "error" in verse_data:
-                error_msg = verse_data.get("message", "Failed to fetch verse") if verse_data else "Failed to fetch verse"
-                await response_handler.emit_error(
-                    error_message=error_msg,
-                    error_code=404
+            cached_result = await self._get_cached(cache_key)
+            if cached_result:
+                logger.info("💾 Cache hit for: %s", verse_reference)
+                await response_handler.emit_text_block(
+                    "STATUS",
+                    "✨ Found cached explanation"
+                )
+                await self._stream_cached_response(
+                    cached_result, 
+                    response_handler
                 )
-                await response_handler.complete()
                 return
             
-            # Emit verse data as JSON
-            await response_handler.emit_json("VERSE_DATA", verse_data)
-            
-            # Display the verse text
-            verse_text_formatted = self.bible_service.format_verse_text(verse_data)
-            await response_handler.emit_text_block(
-                "VERSE_TEXT",
-                verse_text_formatted
-            )
-            
-            # Generate explanation using LLM
-            await response_handler.emit_text_block(
-                "STATUS",
-                "🤖 Generating explanation..."
-            )
-            
-            # Stream the explanation
-            explanation_stream = response_handler.create_text_stream(
-                "EXPLANATION"
-            )
-            
-            # Add header
-            await explanation_stream.emit_chunk("\n## 📚 Explanation\n\n")
-            
-            # Collect explanation for caching
-            full_explanation = ""
-            
-            async for chunk in self.llm_service.explain_verse(
-                verse_reference=verse_data.get("reference", verse_reference),
-                verse_text=verse_data.get("text", ""),
-                user_question=user_prompt
-            ):
-                await explanation_stream.emit_chunk(chunk)
-                full_explanation += chunk
-            
-            await explanation_stream.complete()
+            # Join an identical query that is already being answered
+            flight = self._inflight.get(cache_key)
+            if flight is not None:
+                logger.info("🔗 Joining in-flight query for: %s", verse_reference)
+                await self._follow_inflight(
+                    flight,
+                    verse_reference,
+                    response_handler
+                )
+                return
             
-            # Cache the result
-            if self.cache_manager:
-                cache_data = {
-                    "verse_reference": verse_reference,
-                    "verse_data": verse_data,
-                    "verse_text": verse_text_formatted,
-                    "explanation": full_explanation
-                }
-                await self.cache_manager.set(cache_key, cache_data)
-                logger.info(f"💾 Cached result for: {verse_reference}")
+            flight = _InflightQuery()
+            self._inflight[cache_key] = flight
+            flight_error = None
             
-            # Complete the response
-            await response_handler.complete()
-            logger.info("✅ Query processed successfully")
+            try:
+                # Fetch verse from Bible API
+                await response_handler.emit_text_block(
+                    "STATUS",
+                    f"📖 Looking up {verse_reference}..."
+                )
+                
+                verse_data = await self._get_verse_data(verse_reference)
+                flight.verse.set_result(verse_data)
+                
+                if not verse_data or "error" in verse_data:
+                    error_msg = verse_data.get("message", "Failed to fetch verse") if verse_data else "Failed to fetch verse"
+                    await response_handler.emit_error(
+                        error_message=error_msg,
+                        error_code=404
+                    )
+                    await response_handler.complete()
+                    return
+                
+                # Emit verse data as JSON
+                await response_handler.emit_json("VERSE_DATA", verse_data)
+                
+                # Display the verse text
+                verse_text_formatted = self.bible_service.format_verse_text(verse_data)
+                await response_handler.emit_text_block(
+                    "VERSE_TEXT",
+                    verse_text_formatted
+                )
+                
+                # Generate explanation using LLM
+                await response_handler.emit_text_block(
+                    "STATUS",
+                    "🤖 Generating explanation..."
+                )
+                
+                # Stream the explanation
+                explanation_stream = response_handler.create_text_stream(
+                    "EXPLANATION"
+                )
+                
+                # Add header
+                await explanation_stream.emit_chunk("\n## 📚 Explanation\n\n")
+                
+                # Collect explanation for caching and share it with followers
+                # (methods bound once, outside the per-token loop)
+                emit = explanation_stream.emit_chunk
+                publish = flight.publish
+                async for chunk in self.llm_service.explain_verse(
+                    verse_reference=verse_data.get("reference", verse_reference),
+                    verse_text=verse_data.get("text", ""),
+                    user_question=user_prompt
+                ):
+                    await emit(chunk)
+                    publish(chunk)
+                
+                full_explanation = "".join(flight.chunks)
+                
+                await explanation_stream.complete()
+                
+                # Cache the result
+                if self.cache_manager:
+                    cache_data = {
+                        "verse_reference": verse_reference,
+                        "verse_data": verse_data,
+                        "verse_text": verse_text_formatted,
+                        "explanation": full_explanation
+                    }
+                    await self._set_cached(cache_key, cache_data)
+                    logger.info("💾 Cached result for: %s", verse_reference)
+                
+                # Complete the response
+                await response_handler.complete()
+                logger.info("✅ Query processed successfully")
+                
+            except BaseException as e:
+                flight_error = e
+                raise
+            finally:
+                if not flight.verse.done():
+                    flight.verse.set_result(None)
+                flight.finish(error=flight_error)
+                self._inflight.pop(cache_key, None)
             
         except Exception as e:
-            logger.error(f"❌ Error processing query: {str(e)}", exc_info=True)
+            logger.error("❌ Error processing query: %s", e, exc_info=True)
             await response_handler.emit_error(
                 error_message=f"An error occurred: {str(e)}",
                 error_code=500
             )
             await response_handler.complete()
     
+    async def _follow_inflight(
+        self,
+        flight: "_InflightQuery",
+        verse_reference: str,
+        response_handler: ResponseHandler
+    ):
+        """Stream the result of an identical query another request is running."""
+        await response_handler.emit_text_block(
+            "STATUS",
+            f"📖 Looking up {verse_reference}..."
+        )
+        
+        # Shield so a disconnecting follower doesn't cancel the shared future
+        verse_data = await asyncio.shield(flight.verse)
+        
+        if verse_data is None and flight.error is not None:
+            await self._emit_flight_error(flight, response_handler)
+            return
+        
+        if not verse_data or "error" in verse_data:
+            error_msg = verse_data.get("message", "Failed to fetch verse") if verse_data else "Failed to fetch verse"
+            await response_handler.emit_error(
+                error_message=error_msg,
+                error_code=404
+            )
+            await response_handler.complete()
+            return
+        
+        await response_handler.emit_json("VERSE_DATA", verse_data)
+        await response_handler.emit_text_block(
+            "VERSE_TEXT",
+            self.bible_service.format_verse_text(verse_data)
+        )
+        await response_handler.emit_text_block(
+            "STATUS",
+            "🤖 Generating explanation..."
+        )
+        
+        explanation_stream = response_handler.create_text_stream(
+            "EXPLANATION"
+        )
+        await explanation_stream.emit_chunk("\n## 📚 Explanation\n\n")
+        
+        chunks = flight.subscribe()
+        emit = explanation_stream.emit_chunk
+        while (chunk := await chunks.get()) is not None:
+            await emit(chunk)
+        
+        if flight.error is not None:
+            await self._emit_flight_error(flight, response_handler)
+            return
+        
+        await explanation_stream.complete()
+        await response_handler.complete()
+    
+    async def _emit_flight_error(
+        self,
+        flight: "_InflightQuery",
+        response_handler: ResponseHandler
+    ):
+        """Report the leader's failure to a follower, as assist does for itself."""
+        if isinstance(flight.error, asyncio.CancelledError):
+            # The leading request went away; its error says nothing useful
+            error_msg = "The request answering this query was cancelled. Please try again."
+        else:
+            error_msg = f"An error occurred: {str(flight.error)}"
+        await response_handler.emit_error(
+            error_message=error_msg,
+            error_code=500
+        )
+        await response_handler.complete()
+    
+    async def _get_cached(self, cache_key: str):
+        """Look up a result in the in-memory tier, then on disk."""
+        if not self.cache_manager:
+            return None
+        
+        cached_result = self._hot.get(cache_key)
+        if cached_result is None:
+            cached_result = await self.cache_manager.get(cache_key)
+            if cached_result:
+                self._hot[cache_key] = cached_result
+        return cached_result
+    
+    async def _set_cached(self, cache_key: str, value: dict):
+        """Store a result in both cache tiers."""
+        self._hot[cache_key] = value
+        await self.cache_manager.set(cache_key, value)
+    
+    async def _get_verse_data(self, verse_reference: str):
+        """Fetch verse data, going through the cache when enabled."""
+        verse_key = f"verse:{verse_reference}"
+        verse_data = await self._get_cached(verse_key)
+        if verse_data:
+            return verse_data
+        
+        if not self.cache_manager:
+            return await self.bible_service.get_verse(verse_reference)
+        
+        # Validators outlive the verse entry, so an expired verse is
+        # revalidated with a conditional request instead of refetched
+        cached_entry = await self.validator_cache.get(verse_key)
+        entry = await self.bible_service.fetch_verse(verse_reference, cached_entry)
+        verse_data = entry["data"]
+        if verse_data and "error" not in verse_data:
+            await self._set_cached(verse_key, verse_data)
+            if entry is not cached_entry and (entry["etag"] or entry["last_modified"]):
+                await self.validator_cache.set(verse_key, entry)
+        return verse_data
+    
+    async def prewarm(self):
+        """
+        Fetch uncached PREWARM_VERSES into the cache so first lookups are warm.
+        
+        bible-api.com rate-limits per IP, so misses are fetched in small
+        batches spaced PREWARM_INTERVAL_SECONDS apart, and prewarming stops
+        at the first failed batch to leave the budget for real users.
+        """
+        if not self.cache_manager:
+            return
+        
+        try:
+            missing = [
+                verse_reference
+                for verse_reference in self.PREWARM_VERSES
+                if not await self._get_cached(f"verse:{verse_reference}")
+            ]
+            
+            warmed = 0
+            for i in range(0, len(missing), self.PREWARM_BATCH_SIZE):
+                if i:
+                    await asyncio.sleep(self.PREWARM_INTERVAL_SECONDS)
+                
+                results = await asyncio.gather(*(
+                    self._get_verse_data(verse_reference)
+                    for verse_reference in missing[i:i + self.PREWARM_BATCH_SIZE]
+                ))
+                failed = False
+                for verse_data in results:
+                    if verse_data and "error" not in verse_data:
+                        warmed += 1
+                    else:
+                        failed = True
+                if failed:
+                    logger.warning("⚠️ Cache prewarm stopped early after a failed fetch")
+                    break
+            
+            logger.info(
+                "🔥 Prewarmed %s verses (%s already cached)",
+                warmed,
+                len(self.PREWARM_VERSES) - len(missing)
+            )
+        except Exception as e:
+            logger.warning("⚠️ Cache prewarm failed: %s", e)
+    
     def _is_greeting(self, prompt: str) -> bool:
         """Check if the prompt is a greeting."""
-        prompt_lower = prompt.lower()
-        return any(
-            pattern in prompt_lower 
-            for pattern in self.GREETING_PATTERNS
-        )
+        return self._greeting_re.search(prompt) is not None
     
-    async def _handle_greeting(self, response_handler: ResponseHandler):
-        """Handle greeting queries."""
-        greeting_response = f"""
+    def _build_greeting(self) -> str:
+        """Build the greeting message (done once at init)."""
+        return f"""
 Hello! I'm **{self.name}** 📖
 
 **What I can do:**
@@ -233,10 +563,12 @@ Simply ask me about any Bible verse! Here are some examples:
 
 What verse would you like to explore today?
         """.strip()
-        
+    
+    async def _handle_greeting(self, response_handler: ResponseHandler):
+        """Handle greeting queries."""
         await response_handler.emit_text_block(
             "GREETING",
-            greeting_response
+            self._greeting_response
         )
         await response_handler.complete()
     
@@ -269,13 +601,8 @@ What verse would you like to explore today?
             
             await explanation_stream.emit_chunk("\n## 📚 Explanation\n\n")
             
-            # Stream cached explanation in chunks
-            explanation = cached_data["explanation"]
-            chunk_size = 50  # characters per chunk
-            
-            for i in range(0, len(explanation), chunk_size):
-                chunk = explanation[i:i + chunk_size]
-                await explanation_stream.emit_chunk(chunk)
+            # The explanation is already local, so send it in one go
+            await explanation_stream.emit_chunk(cached_data["explanation"])
             
             await explanation_stream.complete()
         
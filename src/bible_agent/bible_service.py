@@ -1,19 +1,46 @@
 
 
+import asyncio
 import aiohttp
 import logging
 from typing import Dict, Optional
 from config.bible_config import BibleConfig
+from .http_client import get_shared_session
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional
+    import json
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
 
+def _without_validators(data: Dict) -> Dict:
+    """Wrap a response that carries no cache validators as a fetch_verse entry."""
+    return {"data": data, "etag": None, "last_modified": None}
+
+
 class BibleService:
     """Service for fetching Bible verses from bible-api.com."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the Bible service.
+        
+        Args:
+            session: Optional externally owned HTTP session to use instead
+                of the process-wide shared one
+        """
         self.config = BibleConfig()
-        logger.info(f"📖 Bible API initialized (Translation: {self.config.DEFAULT_TRANSLATION})")
+        self._http_session = session
+        self._timeout = aiohttp.ClientTimeout(total=self.config.TIMEOUT)
+        self._headers = {
+            'User-Agent': 'BibleVerseAgent/1.0',
+            'Accept': 'application/json'
+        }
+        logger.info("📖 Bible API initialized (Translation: %s)", self.config.DEFAULT_TRANSLATION)
     
     async def get_verse(self, reference: str) -> Optional[Dict]:
         """
@@ -25,87 +52,144 @@ class BibleService:
         Returns:
             Dict containing verse data or None if failed
         """
+        entry = await self.fetch_verse(reference)
+        return entry["data"]
+    
+    async def fetch_verse(
+        self,
+        reference: str,
+        cached_entry: Optional[Dict] = None
+    ) -> Dict:
+        """
+        Fetch a Bible verse together with its HTTP cache validators.
+        
+        Args:
+            reference: Bible reference (e.g., "John 3:16", "Matthew 7:7")
+            cached_entry: A previous result of this method; its ETag and
+                Last-Modified are sent so an unchanged verse is answered
+                with a 304 and the cached data is reused
+            
+        Returns:
+            Dict with "data" (verse data or error dict), "etag" and
+            "last_modified" (None when the API sent no validators)
+        """
         url = self.config.get_verse_url(reference)
         
-        logger.info(f"📖 Fetching: {reference}")
+        logger.info("📖 Fetching: %s", reference)
+        
+        # Revalidate a previously fetched verse instead of downloading it again
+        headers = self._headers
+        if cached_entry:
+            headers = dict(self._headers)
+            if cached_entry.get("etag"):
+                headers['If-None-Match'] = cached_entry["etag"]
+            if cached_entry.get("last_modified"):
+                headers['If-Modified-Since'] = cached_entry["last_modified"]
         
         try:
-           
-            connector = aiohttp.TCPConnector(verify_ssl=False)
-            timeout = aiohttp.ClientTimeout(total=self.config.TIMEOUT)
+            session = self._http_session or get_shared_session()
             
-            async with aiohttp.ClientSession(
-                connector=connector,
-                timeout=timeout
-            ) as session:
-                # Add headers to help with potential CORS/API issues
-                headers = {
-                    'User-Agent': 'BibleVerseAgent/1.0',
-                    'Accept': 'application/json'
-                }
+            async with session.get(
+                url,
+                headers=headers,
+                timeout=self._timeout
+            ) as response:
+                if response.status == 200:
+                    data = await response.json(loads=json_loads)
+                    logger.info("✅ Fetched: %s", data.get('reference', reference))
+                    return {
+                        "data": data,
+                        "etag": response.headers.get('ETag'),
+                        "last_modified": response.headers.get('Last-Modified')
+                    }
+                
+                elif response.status == 304 and cached_entry:
+                    logger.info("✅ Not modified: %s", reference)
+                    return cached_entry
+                
+                elif response.status == 404:
+                    logger.warning("❌ Verse not found: %s", reference)
+                    return _without_validators({
+                        "error": "Verse not found",
+                        "reference": reference,
+                        "message": "Please check the verse reference and try again. Make sure the book name, chapter, and verse are correct."
+                    })
+                
+                else:
+                    logger.error("❌ API error: %s", response.status)
+                    error_text = await response.text()
+                    logger.error("Response: %s", error_text)
+                    return _without_validators({
+                        "error": "API error",
+                        "reference": reference,
+                        "message": f"The Bible API returned an error (Status: {response.status})"
+                    })
                 
-                async with session.get(url, headers=headers) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        logger.info(f"✅ Fetched: {data.get('reference', reference)}")
-                        return data
-                        
-                    elif response.status == 404:
-                        logger.warning(f"❌ Verse not found: {reference}")
-                        return {
-                            "error": "Verse not found",
-                            "reference": reference,
-                            "message": "Please check the verse reference and try again. Make sure the book name, chapter, and verse are correct."
-                        }
-                        
-                    else:
-                        logger.error(f"❌ API error: {response.status}")
-                        error_text = await response.text()
-                        logger.error(f"Response: {error_text}")
-                        return {
-                            "error": "API error",
-                            "reference": reference,
-                            "message": f"The Bible API returned an error (Status: {response.status})"
-                        }
-                        
         except aiohttp.ClientConnectionError as e:
-            logger.error(f"❌ Connection error: {str(e)}")
-            return {
+            logger.error("❌ Connection error: %s", e)
+            return _without_validators({
                 "error": "Connection error",
                 "reference": reference,
                 "message": "Could not connect to the Bible API. Please check your internet connection."
-            }
+            })
             
         except aiohttp.ClientTimeout as e:
-            logger.error(f"❌ Timeout error: {str(e)}")
-            return {
+            logger.error("❌ Timeout error: %s", e)
+            return _without_validators({
                 "error": "Timeout",
                 "reference": reference,
                 "message": "The Bible API request timed out. Please try again."
-            }
+            })
             
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {str(e)}", exc_info=True)
-            return {
+            logger.error("❌ Unexpected error: %s", e, exc_info=True)
+            return _without_validators({
                 "error": "Unexpected error",
                 "reference": reference,
                 "message": f"An unexpected error occurred: {str(e)}"
-            }
+            })
     
-    async def get_multiple_verses(self, references: list) -> Dict[str, Optional[Dict]]:
+    async def get_multiple_verses(
+        self,
+        references: list,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, Optional[Dict]]:
         """
-        Fetch multiple verses at once.
+        Fetch multiple verses concurrently.
         
         Args:
             references: List of Bible references
+            max_concurrency: Optional cap on simultaneous requests
+                (unbounded by default)
             
         Returns:
             Dict mapping references to their data
         """
-        results = {}
-        for reference in references:
-            results[reference] = await self.get_verse(reference)
-        return results
+        if max_concurrency:
+            semaphore = asyncio.Semaphore(max_concurrency)
+            
+            async def fetch(reference: str) -> Optional[Dict]:
+                async with semaphore:
+                    return await self.get_verse(reference)
+        else:
+            fetch = self.get_verse
+        
+        results = await asyncio.gather(
+            *(fetch(reference) for reference in references),
+            return_exceptions=True
+        )
+        
+        return {
+            reference: (
+                {
+                    "error": "Unexpected error",
+                    "reference": reference,
+                    "message": f"An unexpected error occurred: {str(result)}"
+                }
+                if isinstance(result, BaseException) else result
+            )
+            for reference, result in zip(references, results)
+        }
     
     def format_verse_text(self, verse_data: Dict) -> str:
         """
@@ -0,0 +1,50 @@
+
+
+import aiohttp
+import ssl
+from typing import Optional
+
+
+# Process-wide session used by services that weren't handed one explicitly
+_shared_session: Optional[aiohttp.ClientSession] = None
+
+
+def create_session() -> aiohttp.ClientSession:
+    """
+    Create a pooled HTTP session for bible-api.com and Fireworks.
+    
+    Timeouts are set per request by each service, since the two APIs
+    need different limits. Must be called from within a running event loop.
+    
+    Returns:
+        New aiohttp ClientSession (caller is responsible for closing it)
+    """
+    connector = aiohttp.TCPConnector(
+        # No connection caps: each Fireworks SSE stream holds its connection
+        # for the whole explanation, so a cap would queue users behind each
+        # other. Idle connections are still kept alive and reused.
+        limit=0,
+        limit_per_host=0,
+        ttl_dns_cache=300,
+        keepalive_timeout=60,
+        # A real TLS context also lets sessions be resumed across
+        # pooled connections
+        ssl=ssl.create_default_context()
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
+def get_shared_session() -> aiohttp.ClientSession:
+    """Return the process-wide session, creating it on first use."""
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = create_session()
+    return _shared_session
+
+
+async def close_shared_session():
+    """Close the process-wide session if it was opened."""
+    global _shared_session
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
@@ -2,8 +2,16 @@
 
 import aiohttp
 import logging
-from typing import AsyncIterator, Dict
+from typing import AsyncIterator, Dict, Optional
 from config.llm_config import LLMConfig
+from .http_client import get_shared_session
+
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json accepts bytes too
+    import json
+    json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
@@ -11,8 +19,24 @@ logger = logging.getLogger(__name__)
 class LLMService:
     """Service for interacting with FireworksAI Llama model."""
     
-    def __init__(self):
+    def __init__(self, session: Optional[aiohttp.ClientSession] = None):
+        """
+        Initialize the LLM service.
+        
+        Args:
+            session: Optional externally owned HTTP session to use instead
+                of the process-wide shared one
+        """
         self.config = LLMConfig()
+        self._http_session = session
+        # Bound connecting and each read rather than the whole request, so
+        # long explanations (and time spent waiting for a connection) are
+        # not cut off as long as tokens keep arriving
+        self._timeout = aiohttp.ClientTimeout(
+            total=None,
+            sock_connect=self.config.TIMEOUT,
+            sock_read=self.config.TIMEOUT
+        )
         
         if not self.config.validate():
             raise ValueError("Invalid LLM configuration")
@@ -22,7 +46,7 @@ class LLMService:
             "Content-Type": "application/json"
         }
         
-        logger.info(f"🤖 LLM initialized: {self.config.MODEL}")
+        logger.info("🤖 LLM initialized: %s", self.config.MODEL)
     
     async def explain_verse(
         self, 
@@ -76,52 +100,50 @@ Provide context, meaning, and practical application."""
         url = f"{self.config.BASE_URL}/chat/completions"
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self.config.TIMEOUT)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url, 
-                    json=payload, 
-                    headers=self.headers
-                ) as response:
+            session = self._http_session or get_shared_session()
+            async with session.post(
+                url, 
+                json=payload, 
+                headers=self.headers,
+                timeout=self._timeout
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error("❌ LLM API error: %s - %s", response.status, error_text)
+                    yield f"Error: Unable to generate explanation (Status: {response.status})"
+                    return
+                
+                # Stream the response
+                loads = json_loads  # local binding for the per-token loop
+                async for raw in response.content:
+                    if not raw.startswith(b"data: "):
+                        continue
                     
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ LLM API error: {response.status} - {error_text}")
-                        yield f"Error: Unable to generate explanation (Status: {response.status})"
-                        return
+                    body = raw[6:].rstrip()  # Remove "data: " prefix
+                    if body == b"[DONE]":
+                        continue
                     
-                    # Stream the response
-                    async for line in response.content:
-                        line = line.decode('utf-8').strip()
-                        
-                        if not line or line == "data: [DONE]":
-                            continue
-                        
-                        if line.startswith("data: "):
-                            try:
-                                import json
-                                json_str = line[6:]  # Remove "data: " prefix
-                                data = json.loads(json_str)
-                                
-                                # Extract the content delta
-                                if "choices" in data and len(data["choices"]) > 0:
-                                    delta = data["choices"][0].get("delta", {})
-                                    content = delta.get("content", "")
-                                    
-                                    if content:
-                                        yield content
-                                        
-                            except json.JSONDecodeError:
-                                continue
-                            except Exception as e:
-                                logger.error(f"Error parsing stream: {str(e)}")
-                                continue
+                    try:
+                        data = loads(body)
+                    except ValueError:
+                        continue
                     
+                    # Extract the content delta (keep-alive/usage chunks have
+                    # none); skip malformed events rather than ending the stream
+                    try:
+                        content = data["choices"][0]["delta"].get("content")
+                    except (KeyError, IndexError, TypeError, AttributeError):
+                        continue
+                    
+                    if content:
+                        yield content
+                
         except aiohttp.ClientError as e:
-            logger.error(f"❌ Network error: {str(e)}")
+            logger.error("❌ Network error: %s", e)
             yield f"Error: Network error occurred - {str(e)}"
         except Exception as e:
-            logger.error(f"❌ Unexpected error: {str(e)}")
+            logger.error("❌ Unexpected error: %s", e)
             yield f"Error: An unexpected error occurred - {str(e)}"
     
     async def explain_verse_complete(
@@ -176,24 +198,24 @@ Provide context, meaning, and practical application."""
         url = f"{self.config.BASE_URL}/chat/completions"
         
         try:
-            timeout = aiohttp.ClientTimeout(total=self.config.TIMEOUT)
-            async with aiohttp.ClientSession(timeout=timeout) as session:
-                async with session.post(
-                    url, 
-                    json=payload, 
-                    headers=self.headers
-                ) as response:
-                    
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"❌ LLM API error: {response.status}")
-                        return f"Error: Unable to generate explanation"
-                    
-                    data = await response.json()
-                    content = data["choices"][0]["message"]["content"]
-                    return content
-                    
+            session = self._http_session or get_shared_session()
+            async with session.post(
+                url, 
+                json=payload, 
+                headers=self.headers,
+                timeout=self._timeout
+            ) as response:
+                
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error("❌ LLM API error: %s", response.status)
+                    return f"Error: Unable to generate explanation"
+                
+                data = await response.json()
+                content = data["choices"][0]["message"]["content"]
+                return content
+                
         except Exception as e:
-            logger.error(f"❌ Error: {str(e)}")
+            logger.error("❌ Error: %s", e)
 
             return f"Error: {str(e)}"
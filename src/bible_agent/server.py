@@ -47,7 +47,7 @@ class BibleServerWithCORS:
             expose_headers=["*"]
         )
         
-        logger.info(f"🌐 CORS enabled for origins: {allow_origins}")
+        logger.info("🌐 CORS enabled for origins: %s", allow_origins)
         
         # Register endpoints
         self._app.post('/assist')(self.assist_endpoint)
@@ -69,7 +69,7 @@ class BibleServerWithCORS:
             port: int = 8000
         ):
         """Start the FastAPI server"""
-        logger.info(f"🚀 Starting server on {host}:{port}")
+        logger.info("🚀 Starting server on %s:%s", host, port)
         uvicorn.run(
             self._app,
             host=host, 
@@ -78,6 +78,22 @@ class BibleServerWithCORS:
         )
 
 
+    async def serve(
+            self,
+            host: str = "0.0.0.0",
+            port: int = 8000
+        ):
+        """Run the FastAPI server on the current event loop."""
+        logger.info("🚀 Starting server on %s:%s", host, port)
+        config = uvicorn.Config(
+            self._app,
+            host=host,
+            port=port,
+            log_level="info"
+        )
+        await uvicorn.Server(config).serve()
+
+
     async def __stream_agent_output(self, request: Request):
         """Yield agent output as SSE events."""
 
@@ -116,7 +132,7 @@ class BibleServerWithCORS:
                     break
                     
         except Exception as e:
-            logger.error(f"❌ Stream error: {str(e)}", exc_info=True)
+            logger.error("❌ Stream error: %s", e, exc_info=True)
             
             # Send error event
             yield f"event: error\n"
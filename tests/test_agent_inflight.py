@@ -0,0 +1,161 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from config.bible_config import BibleConfig
+from config.llm_config import LLMConfig
+from src.bible_agent.agent import BibleAgent
+
+VERSE = {"reference": "John 3:16", "text": "For God so loved the world..."}
+PROMPT = "Explain John 3:16"
+
+
+class _RecordingStream:
+    """Text stream that records chunks into its handler's event list."""
+    
+    def __init__(self, events: list):
+        self._events = events
+    
+    async def emit_chunk(self, chunk: str):
+        self._events.append(("chunk", chunk))
+    
+    async def complete(self):
+        self._events.append(("stream_done", None))
+
+
+class _RecordingHandler:
+    """Stand-in for ResponseHandler that records what the agent emits."""
+    
+    def __init__(self):
+        self.events = []
+    
+    async def emit_text_block(self, name: str, text: str):
+        self.events.append(("text", name))
+    
+    async def emit_json(self, name: str, data: dict):
+        self.events.append(("json", name))
+    
+    async def emit_error(self, error_message: str, error_code: int = 500):
+        self.events.append(("error", error_code, error_message))
+    
+    def create_text_stream(self, name: str) -> _RecordingStream:
+        return _RecordingStream(self.events)
+    
+    async def complete(self):
+        self.events.append(("done", None))
+    
+    def chunks(self) -> str:
+        return "".join(event[1] for event in self.events if event[0] == "chunk")
+    
+    def errors(self) -> list:
+        return [event for event in self.events if event[0] == "error"]
+
+
+class InflightQueryTest(unittest.IsolatedAsyncioTestCase):
+    """Identical concurrent queries share one lookup and one explanation."""
+    
+    async def asyncSetUp(self):
+        patches = [
+            mock.patch.object(LLMConfig, "API_KEY", "test-key"),
+            mock.patch.object(BibleConfig, "ENABLE_CACHE", False),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        
+        self.agent = BibleAgent()
+        self.verse_calls = 0
+        self.llm_calls = 0
+        self.llm_started = asyncio.Event()
+        self.llm_release = asyncio.Event()
+        self.llm_error: Exception = None
+        self.agent.bible_service.get_verse = self._get_verse
+        self.agent.llm_service.explain_verse = self._explain_verse
+    
+    async def _get_verse(self, reference: str):
+        self.verse_calls += 1
+        return VERSE
+    
+    async def _explain_verse(self, **kwargs):
+        self.llm_calls += 1
+        for chunk in ("one ", "two ", "three"):
+            yield chunk
+            if chunk == "one ":
+                self.llm_started.set()
+                await self.llm_release.wait()
+        if self.llm_error is not None:
+            raise self.llm_error
+    
+    def _assist(self, handler: _RecordingHandler) -> asyncio.Task:
+        query = SimpleNamespace(prompt=PROMPT)
+        return asyncio.create_task(self.agent.assist(None, query, handler))
+    
+    async def _start_leader_and_followers(self, followers: int = 2):
+        handlers = [_RecordingHandler() for _ in range(followers + 1)]
+        leader = self._assist(handlers[0])
+        await self.llm_started.wait()
+        tasks = [self._assist(handler) for handler in handlers[1:]]
+        # Let the followers find and join the in-flight query
+        await asyncio.sleep(0)
+        return leader, tasks, handlers
+    
+    async def test_followers_replay_leader_explanation(self):
+        leader, tasks, handlers = await self._start_leader_and_followers()
+        self.llm_release.set()
+        await asyncio.gather(leader, *tasks)
+        
+        self.assertEqual(self.verse_calls, 1)
+        self.assertEqual(self.llm_calls, 1)
+        for handler in handlers:
+            self.assertEqual(handler.chunks(), "\n## 📚 Explanation\n\none two three")
+            self.assertEqual(handler.errors(), [])
+            self.assertEqual(handler.events[-2:], [("stream_done", None), ("done", None)])
+        self.assertEqual(self.agent._inflight, {})
+    
+    async def test_leader_failure_is_reported_to_followers(self):
+        self.llm_error = RuntimeError("stream broke")
+        leader, tasks, handlers = await self._start_leader_and_followers()
+        self.llm_release.set()
+        with self.assertLogs("src.bible_agent.agent", "ERROR"):
+            await asyncio.gather(leader, *tasks)
+        
+        for handler in handlers:
+            self.assertEqual(
+                handler.errors(),
+                [("error", 500, "An error occurred: stream broke")]
+            )
+            self.assertNotIn(("stream_done", None), handler.events)
+            self.assertEqual(handler.events[-1], ("done", None))
+        self.assertEqual(self.agent._inflight, {})
+    
+    async def test_leader_cancellation_is_reported_to_followers(self):
+        leader, tasks, handlers = await self._start_leader_and_followers()
+        leader.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        await asyncio.gather(*tasks)
+        
+        for handler in handlers[1:]:
+            self.assertEqual(
+                handler.errors(),
+                [(
+                    "error",
+                    500,
+                    "The request answering this query was cancelled. Please try again."
+                )]
+            )
+            self.assertEqual(handler.events[-1], ("done", None))
+        self.assertEqual(self.agent._inflight, {})
+    
+    async def test_late_request_after_leader_finished_starts_fresh(self):
+        self.llm_release.set()
+        await self._assist(_RecordingHandler())
+        await self._assist(_RecordingHandler())
+        
+        self.assertEqual(self.verse_calls, 2)
+        self.assertEqual(self.llm_calls, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,7 @@
 # ==================== utils/__init__.py ====================
 
 from .cache import CacheManager
+from .redis_cache import RedisCacheManager
 from .verse_parser import VerseParser
 
-__all__ = ["CacheManager", "VerseParser"]
\ No newline at end of file
+__all__ = ["CacheManager", "RedisCacheManager", "VerseParser"]
\ No newline at end of file
@@ -25,7 +25,7 @@ class CacheManager:
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.ttl_seconds = ttl_hours * 3600
-        logger.info(f"💾 Cache initialized: {cache_dir} (TTL: {ttl_hours}h)")
+        logger.info("💾 Cache initialized: %s (TTL: %sh)", cache_dir, ttl_hours)
     
     def _get_cache_path(self, key: str) -> Path:
         """Generate cache file path from key."""
@@ -52,17 +52,17 @@ class CacheManager:
             # Check if expired
             file_age = time.time() - cache_file.stat().st_mtime
             if file_age > self.ttl_seconds:
-                logger.info(f"🗑️ Cache expired: {key[:20]}...")
+                logger.info("🗑️ Cache expired: %.20s...", key)
                 cache_file.unlink()
                 return None
             
             # Read and return cached data
             data = json.loads(cache_file.read_text())
-            logger.info(f"✅ Cache hit: {key[:20]}... (age: {file_age:.0f}s)")
+            logger.info("✅ Cache hit: %.20s... (age: %.0fs)", key, file_age)
             return data
             
         except Exception as e:
-            logger.error(f"❌ Cache read error: {str(e)}")
+            logger.error("❌ Cache read error: %s", e)
             return None
     
     async def set(self, key: str, value: Any) -> bool:
@@ -82,11 +82,11 @@ class CacheManager:
             
             # Write to cache
             cache_file.write_text(json.dumps(value, indent=2))
-            logger.info(f"💾 Cached: {key[:20]}...")
+            logger.info("💾 Cached: %.20s...", key)
             return True
             
         except Exception as e:
-            logger.error(f"❌ Cache write error: {str(e)}")
+            logger.error("❌ Cache write error: %s", e)
             return False
     
     async def delete(self, key: str) -> bool:
@@ -94,16 +94,20 @@ class CacheManager:
         cache_file = self._get_cache_path(key)
         if cache_file.exists():
             cache_file.unlink()
-            logger.info(f"🗑️ Cache deleted: {key[:20]}...")
+            logger.info("🗑️ Cache deleted: %.20s...", key)
             return True
         return False
     
-    def clear_all(self) -> int:
+    async def clear_all(self) -> int:
         """Clear all cache entries."""
         count = 0
         for cache_file in self.cache_dir.glob("*.json"):
             cache_file.unlink()
             count += 1
-        logger.info(f"🗑️ Cleared {count} cache entries")
+        logger.info("🗑️ Cleared %s cache entries", count)
 
         return count
+    
+    async def close(self):
+        """Nothing to release; present for parity with RedisCacheManager."""
+        pass
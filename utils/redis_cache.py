@@ -0,0 +1,160 @@
+
+
+import hashlib
+from typing import Optional, Any
+import logging
+
+try:
+    import redis.asyncio as aioredis
+except ImportError:  # Only needed when CACHE_BACKEND=redis
+    aioredis = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # Compression is optional
+    lz4_frame = None
+
+try:
+    import orjson
+    json_dumps = orjson.dumps
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+    def json_dumps(value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+logger = logging.getLogger(__name__)
+
+# First byte of every stored value, marking how the payload is encoded
+_RAW = b"\x00"
+_LZ4 = b"\x01"
+
+
+class RedisCacheManager:
+    """Async Redis-backed cache manager with TTL support, shared across workers."""
+    
+    def __init__(
+        self,
+        redis_url: str = "redis://localhost:6379/0",
+        ttl_hours: int = 168,
+        key_prefix: str = "bible_agent:",
+        max_connections: int = 50
+    ):
+        """
+        Initialize cache manager.
+        
+        Args:
+            redis_url: Redis connection URL
+            ttl_hours: Time-to-live in hours (default: 168 = 7 days)
+            key_prefix: Namespace prepended to every key
+            max_connections: Size of the Redis connection pool
+        """
+        if aioredis is None:
+            raise ImportError(
+                "The redis package is required for CACHE_BACKEND=redis "
+                "(pip install redis)"
+            )
+        
+        self.redis = aioredis.Redis.from_url(
+            redis_url,
+            max_connections=max_connections
+        )
+        self.key_prefix = key_prefix
+        self.ttl_seconds = ttl_hours * 3600
+        logger.info(
+            "💾 Redis cache initialized: %s (TTL: %sh, compression: %s)",
+            redis_url,
+            ttl_hours,
+            "lz4" if lz4_frame else "off"
+        )
+    
+    def _get_cache_key(self, key: str) -> str:
+        """Generate Redis key from cache key."""
+        # Use SHA-256 hash to keep keys short and safe
+        key_hash = hashlib.sha256(key.encode()).hexdigest()
+        return f"{self.key_prefix}{key_hash}"
+    
+    @staticmethod
+    def _encode(value: Any) -> bytes:
+        """Serialize (and compress when lz4 is available) a value."""
+        payload = json_dumps(value)
+        if lz4_frame is not None:
+            return _LZ4 + lz4_frame.compress(payload)
+        return _RAW + payload
+    
+    @staticmethod
+    def _decode(blob: bytes) -> Any:
+        """Inverse of _encode."""
+        marker, payload = blob[:1], blob[1:]
+        if marker == _LZ4:
+            payload = lz4_frame.decompress(payload)
+        return json_loads(payload)
+    
+    async def get(self, key: str) -> Optional[dict]:
+        """
+        Retrieve value from cache.
+        
+        Args:
+            key: Cache key
+        
+        Returns:
+            Cached value or None if not found/expired
+        """
+        try:
+            blob = await self.redis.get(self._get_cache_key(key))
+            if blob is None:
+                return None
+            
+            data = self._decode(blob)
+            logger.info("✅ Cache hit: %.20s...", key)
+            return data
+        
+        except Exception as e:
+            logger.error("❌ Cache read error: %s", e)
+            return None
+    
+    async def set(self, key: str, value: Any) -> bool:
+        """
+        Store value in cache.
+        
+        Args:
+            key: Cache key
+            value: Value to cache (must be JSON serializable)
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            await self.redis.set(
+                self._get_cache_key(key),
+                self._encode(value),
+                ex=self.ttl_seconds
+            )
+            logger.info("💾 Cached: %.20s...", key)
+            return True
+        
+        except Exception as e:
+            logger.error("❌ Cache write error: %s", e)
+            return False
+    
+    async def delete(self, key: str) -> bool:
+        """Delete a cache entry."""
+        deleted = await self.redis.delete(self._get_cache_key(key))
+        if deleted:
+            logger.info("🗑️ Cache deleted: %.20s...", key)
+        return bool(deleted)
+    
+    async def clear_all(self) -> int:
+        """Clear all cache entries under this manager's prefix."""
+        count = 0
+        async for redis_key in self.redis.scan_iter(match=f"{self.key_prefix}*"):
+            count += await self.redis.delete(redis_key)
+        logger.info("🗑️ Cleared %s cache entries", count)
+        
+        return count
+    
+    async def close(self):
+        """Close the Redis connection pool."""
+        await self.redis.aclose()